@@ -2,18 +2,82 @@
 from __future__ import annotations
 
 import math
-from array import array
-from typing import Iterable, Protocol
+from functools import lru_cache
 
+import numpy as np
 import pygame
 
 from .config import SAMPLE_RATE
-
-
-class HasPosition(Protocol):
-    """Protocol describing objects that expose a pygame position vector."""
-
-    pos: pygame.Vector2
+from .kernels import min_distance_sq
+
+_PROXIMITY_RANGE = 420
+_PROXIMITY_RANGE_SQ = _PROXIMITY_RANGE * _PROXIMITY_RANGE
+_PROXIMITY_REFRESH_FRAMES = 3
+_PROXIMITY_MOVE_TOLERANCE_SQ = 2 * 2
+_SINE_TABLE_SIZE = 4096
+_SINE_TABLE = np.sin(np.linspace(0.0, math.tau, _SINE_TABLE_SIZE, endpoint=False)).astype(np.float32)
+
+
+def _table_sin(phase: np.ndarray) -> np.ndarray:
+    """Approximate ``np.sin`` for non-negative phases via the shared sine table."""
+
+    index = (phase * (_SINE_TABLE_SIZE / math.tau)).astype(np.int64) & (_SINE_TABLE_SIZE - 1)
+    return _SINE_TABLE[index]
+
+
+def _to_pcm(sample: np.ndarray, volume: float) -> bytes:
+    """Scale a ``[-1, 1]`` float signal by ``volume`` into 16-bit PCM bytes."""
+
+    return (sample * (volume * 32767)).clip(-32768, 32767).astype(np.int16).tobytes()
+
+
+# The synthesised PCM depends only on these fixed parameters, so each buffer is
+# rendered once per process and shared by every AudioManager.
+@lru_cache(maxsize=None)
+def _wave_pcm(
+    frequency: float, duration: float, volume: float, harmonics: tuple[tuple[float, float], ...]
+) -> bytes:
+    sample_count = max(1, int(SAMPLE_RATE * duration))
+    attack = int(0.02 * SAMPLE_RATE)
+    release = int(0.04 * SAMPLE_RATE)
+    index = np.arange(sample_count, dtype=np.float64)
+    base_phase = index * (frequency * math.tau / SAMPLE_RATE)
+    # The fundamental and its harmonics are summed as one (partials, samples) block.
+    multipliers = np.array([1.0, *(multiplier for multiplier, _ in harmonics)])
+    weights = np.array([1.0, *(weight for _, weight in harmonics)], dtype=np.float32)
+    sample = weights @ _table_sin(base_phase * multipliers[:, None])
+    envelope = np.ones(sample_count)
+    if attack:
+        envelope *= np.minimum(1.0, index / max(1, attack))
+    if release:
+        envelope *= np.clip((sample_count - index) / max(1, release), 0.0, 1.0)
+    return _to_pcm(sample * envelope, volume)
+
+
+@lru_cache(maxsize=None)
+def _death_pcm() -> bytes:
+    duration = 0.6
+    sample_count = max(1, int(SAMPLE_RATE * duration))
+    t = np.arange(sample_count, dtype=np.float64) / SAMPLE_RATE
+    freq = np.maximum(70.0, 320.0 * (1 - t))
+    phase = freq * math.tau * t
+    envelope = np.maximum(0.0, 1 - t / duration)
+    return _to_pcm(_table_sin(phase) * envelope, 0.5)
+
+
+@lru_cache(maxsize=None)
+def _proximity_pcm() -> bytes:
+    duration = 0.5
+    sample_count = max(1, int(SAMPLE_RATE * duration))
+    pulse_width = int(0.08 * SAMPLE_RATE)
+    index = np.arange(sample_count, dtype=np.float64)
+    cycle_position = np.mod(index, int(0.25 * SAMPLE_RATE))
+    envelope = np.where(
+        cycle_position < pulse_width, 1.0 - cycle_position / max(1, pulse_width), 0.0
+    )
+    noise = _table_sin(index / SAMPLE_RATE * 220 * math.tau) * 0.6
+    sample = (noise + _table_sin(index / SAMPLE_RATE * 440 * math.tau) * 0.3) * envelope
+    return _to_pcm(sample, 0.4)
 
 
 class AudioManager:
@@ -21,6 +85,11 @@ class AudioManager:
 
     def __init__(self) -> None:
         self.available = True
+        # Proximity is only re-evaluated when the enemy count changes, the player
+        # moves, or the refresh interval elapses; see update_enemy_proximity.
+        self._proximity_anchor = (0.0, 0.0)
+        self._proximity_count = -1
+        self._proximity_age = 0
         try:
             if not pygame.mixer.get_init():
                 pygame.mixer.init(frequency=SAMPLE_RATE, size=-16, channels=1)
@@ -44,61 +113,21 @@ class AudioManager:
         *,
         harmonics: list[tuple[float, float]] | None = None,
     ) -> bytes:
-        sample_count = max(1, int(SAMPLE_RATE * duration))
-        data = array("h")
-        harmonics = harmonics or []
-        attack = int(0.02 * SAMPLE_RATE)
-        release = int(0.04 * SAMPLE_RATE)
-        for index in range(sample_count):
-            base_phase = (index / SAMPLE_RATE) * frequency * math.tau
-            sample = math.sin(base_phase)
-            for multiplier, weight in harmonics:
-                sample += weight * math.sin(base_phase * multiplier)
-            envelope = 1.0
-            if attack:
-                envelope *= min(1.0, index / max(1, attack))
-            if release and index >= sample_count - release:
-                envelope *= max(0.0, (sample_count - index) / max(1, release))
-            data.append(int(sample * volume * 32767 * envelope))
-        return data.tobytes()
+        return _wave_pcm(frequency, duration, volume, tuple(harmonics or ()))
 
     def _create_engine_sound(self) -> pygame.mixer.Sound:
-        buffer = array("h")
         chunk = self._generate_wave(110, 0.18, 0.25, harmonics=[(2.0, 0.35), (3.0, 0.2)])
-        buffer.frombytes(chunk)
-        return pygame.mixer.Sound(buffer=buffer.tobytes())
+        return pygame.mixer.Sound(buffer=chunk)
 
     def _create_shot_sound(self) -> pygame.mixer.Sound:
         chunk = self._generate_wave(760, 0.12, 0.35, harmonics=[(1.5, 0.5), (2.0, 0.3)])
         return pygame.mixer.Sound(buffer=chunk)
 
     def _create_death_sound(self) -> pygame.mixer.Sound:
-        duration = 0.6
-        sample_count = max(1, int(SAMPLE_RATE * duration))
-        data = array("h")
-        for index in range(sample_count):
-            t = index / SAMPLE_RATE
-            freq = max(70.0, 320.0 * (1 - t))
-            phase = freq * math.tau * t
-            envelope = max(0.0, 1 - t / duration)
-            sample = math.sin(phase) * envelope
-            data.append(int(sample * 0.5 * 32767))
-        return pygame.mixer.Sound(buffer=data.tobytes())
+        return pygame.mixer.Sound(buffer=_death_pcm())
 
     def _create_proximity_loop(self) -> pygame.mixer.Sound:
-        duration = 0.5
-        sample_count = max(1, int(SAMPLE_RATE * duration))
-        data = array("h")
-        pulse_width = int(0.08 * SAMPLE_RATE)
-        for index in range(sample_count):
-            cycle_position = index % int(0.25 * SAMPLE_RATE)
-            envelope = 0.0
-            if cycle_position < pulse_width:
-                envelope = 1.0 - (cycle_position / max(1, pulse_width))
-            noise = math.sin(index / SAMPLE_RATE * 220 * math.tau) * 0.6
-            sample = (noise + math.sin(index / SAMPLE_RATE * 440 * math.tau) * 0.3) * envelope
-            data.append(int(sample * 0.4 * 32767))
-        return pygame.mixer.Sound(buffer=data.tobytes())
+        return pygame.mixer.Sound(buffer=_proximity_pcm())
 
     def update_player_movement(self, moving: bool) -> None:
         if not self.available:
@@ -121,22 +150,30 @@ class AudioManager:
             return
         self.death_sound.play()
 
-    def update_enemy_proximity(
-        self, player_pos: pygame.Vector2, enemies: Iterable[HasPosition]
-    ) -> None:
+    def update_enemy_proximity(self, player_pos: pygame.Vector2, enemy_positions: np.ndarray) -> None:
+        """Scale the proximity loop by the nearest of ``enemy_positions`` (an ``(n, 2)`` array)."""
+
         if not self.available:
             return
-        enemy_positions = [enemy.pos for enemy in enemies]
-        if not enemy_positions:
-            if self.proximity_channel.get_busy():
-                self.proximity_channel.fadeout(200)
+        count = len(enemy_positions)
+        anchor_x, anchor_y = self._proximity_anchor
+        moved_sq = (player_pos.x - anchor_x) ** 2 + (player_pos.y - anchor_y) ** 2
+        if (
+            count == self._proximity_count
+            and self._proximity_age < _PROXIMITY_REFRESH_FRAMES
+            and moved_sq < _PROXIMITY_MOVE_TOLERANCE_SQ
+        ):
+            self._proximity_age += 1
             return
-        min_distance = min(player_pos.distance_to(position) for position in enemy_positions)
-        proximity = max(0.0, min(1.0, 1 - min_distance / 420))
-        if proximity <= 0:
+        self._proximity_anchor = (player_pos.x, player_pos.y)
+        self._proximity_count = count
+        self._proximity_age = 1
+        nearest_sq = min_distance_sq(enemy_positions, (player_pos.x, player_pos.y))
+        if nearest_sq >= _PROXIMITY_RANGE_SQ:
             if self.proximity_channel.get_busy():
                 self.proximity_channel.fadeout(200)
             return
+        proximity = min(1.0, 1 - math.sqrt(nearest_sq) / _PROXIMITY_RANGE)
         if not self.proximity_channel.get_busy():
             self.proximity_channel.play(self.proximity_sound, loops=-1)
         self.proximity_channel.set_volume(0.1 + proximity * 0.5)
@@ -146,6 +183,7 @@ class AudioManager:
             return
         self.move_channel.stop()
         self.proximity_channel.stop()
+        self._proximity_count = -1
 
 
-__all__ = ["AudioManager", "HasPosition"]
+__all__ = ["AudioManager"]
@@ -1,46 +1,59 @@
 """Simple star field background animation."""
 from __future__ import annotations
 
-import random
-from dataclasses import dataclass
-from typing import List
-
+import numpy as np
 import pygame
 
 from .config import HEIGHT, WIDTH
+from .rng import RNG
 
-
-@dataclass
-class Star:
-    position: pygame.Vector2
-    speed: float
-    size: int
-
-    def update(self, dt: float) -> None:
-        self.position.y += self.speed * dt
-        if self.position.y > HEIGHT:
-            self.position.y = -10
-            self.position.x = random.uniform(0, WIDTH)
+STAR_COUNT = 120
+STAR_LAYER_SPEEDS = (30.0, 50.0, 70.0)
 
 
 class StarField:
-    def __init__(self) -> None:
-        self.stars: List[Star] = [
-            Star(
-                pygame.Vector2(random.uniform(0, WIDTH), random.uniform(0, HEIGHT)),
-                random.uniform(20, 80),
-                random.randint(1, 3),
-            )
-            for _ in range(120)
+    """Scrolling stars pre-rendered onto one wrapping layer per star size.
+
+    Larger stars sit on faster layers for a parallax effect. Each layer is a
+    colour-keyed, RLE-accelerated screen-sized surface, so a frame costs two
+    blits per layer regardless of how many stars it holds.
+    """
+
+    def __init__(self, count: int = STAR_COUNT) -> None:
+        self.speeds = np.array(STAR_LAYER_SPEEDS, dtype=np.float64)
+        self.offsets = np.zeros(len(STAR_LAYER_SPEEDS), dtype=np.float64)
+        sizes = RNG.integers(1, len(STAR_LAYER_SPEEDS) + 1, count)
+        x = RNG.uniform(0, WIDTH, count)
+        y = RNG.uniform(0, HEIGHT, count)
+        self._layers = [
+            self._render_layer(size, x[sizes == size], y[sizes == size])
+            for size in range(1, len(STAR_LAYER_SPEEDS) + 1)
         ]
 
+    @staticmethod
+    def _render_layer(size: int, x: np.ndarray, y: np.ndarray) -> pygame.Surface:
+        layer = pygame.Surface((WIDTH, HEIGHT))
+        if pygame.display.get_surface() is not None:
+            layer = layer.convert()
+        layer.fill((0, 0, 0))
+        # Keep whole dots inside the layer so none are clipped at the wrap seam.
+        y = np.clip(y, size, HEIGHT - size)
+        for star_x, star_y in zip(x.tolist(), y.tolist()):
+            pygame.draw.circle(layer, (size * 40, size * 40, 255), (star_x, star_y), size)
+        layer.set_colorkey((0, 0, 0), pygame.RLEACCEL)
+        return layer
+
     def update(self, dt: float) -> None:
-        for star in self.stars:
-            star.update(dt)
+        self.offsets += self.speeds * dt
+        np.mod(self.offsets, HEIGHT, out=self.offsets)
 
     def draw(self, surface: pygame.Surface) -> None:
-        for star in self.stars:
-            pygame.draw.circle(surface, (star.size * 40, star.size * 40, 255), star.position, star.size)
+        blits = []
+        for layer, offset in zip(self._layers, self.offsets.tolist()):
+            top = int(offset)
+            blits.append((layer, (0, top)))
+            blits.append((layer, (0, top - HEIGHT)))
+        surface.blits(blits, doreturn=False)
 
 
-__all__ = ["Star", "StarField"]
+__all__ = ["StarField"]
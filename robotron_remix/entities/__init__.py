@@ -1,6 +1,16 @@
 """Entity exports for Robotron Remix."""
-from .bullet import Bullet
-from .enemy import Enemy, EnemyAppearance
+from .bullet import Bullet, BulletGroup
+from .enemy import Enemy, EnemyAppearance, EnemyGroup, get_enemy_surface
+from .packed_group import PackedGroup
 from .player import Player
 
-__all__ = ["Bullet", "Enemy", "EnemyAppearance", "Player"]
+__all__ = [
+    "Bullet",
+    "BulletGroup",
+    "Enemy",
+    "EnemyAppearance",
+    "EnemyGroup",
+    "PackedGroup",
+    "Player",
+    "get_enemy_surface",
+]
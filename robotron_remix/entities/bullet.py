@@ -1,25 +1,98 @@
 """Projectile entities."""
 from __future__ import annotations
 
+from typing import Tuple
+
+import numpy as np
 import pygame
 
 from ..config import BULLET_COLOR, BULLET_SPEED, HEIGHT, WIDTH
-from ..particles import ParticleSystem, emit_trail
+from ..particles import TRAIL_INTERVAL, ParticleSystem
+from ..surfaces import to_display_format
+from .packed_group import PackedGroup
+
+
+BULLET_SIZE = 10
+
+_BULLET_IMAGE: pygame.Surface | None = None
+
+
+def _bullet_image() -> pygame.Surface:
+    """Return the shared bullet surface, drawing and converting it on first use."""
+
+    global _BULLET_IMAGE
+    if _BULLET_IMAGE is None:
+        image = pygame.Surface((BULLET_SIZE, BULLET_SIZE), pygame.SRCALPHA)
+        radius = BULLET_SIZE // 2
+        pygame.draw.circle(image, BULLET_COLOR, (radius, radius), radius)
+        _BULLET_IMAGE = to_display_format(image)
+    return _BULLET_IMAGE
 
 
 class Bullet(pygame.sprite.Sprite):
-    def __init__(self, pos: pygame.Vector2, direction: pygame.Vector2, particles: ParticleSystem) -> None:
+    def __init__(self, pos: pygame.Vector2, direction: pygame.Vector2) -> None:
         super().__init__()
-        self.pos = pygame.Vector2(pos)
-        self.direction = pygame.Vector2(direction)
+        self.image = _bullet_image()
+        self.rect = self.image.get_rect()
+        self.reset(pos, direction)
+
+    def reset(self, pos: pygame.Vector2, direction: pygame.Vector2) -> None:
+        """Re-initialise a recycled bullet in place for a new shot."""
+
+        self.pos_x, self.pos_y = pos
+        self.dir_x, self.dir_y = direction
+        self.rect.center = (int(self.pos_x), int(self.pos_y))
+
+
+class BulletGroup(PackedGroup[Bullet]):
+    """Sprite group advancing every bullet with one broadcast per frame.
+
+    Each row holds ``(x, y, dx, dy)``; bullets leaving the padded screen bounds
+    are killed. On-screen bullets share one trail clock and emit their trail
+    puffs into ``particles`` as a single batch every ``TRAIL_INTERVAL`` seconds.
+    """
+
+    columns = 4
+    extent = (BULLET_SIZE, BULLET_SIZE)
+
+    def __init__(self, particles: ParticleSystem, *sprites: Bullet) -> None:
         self.particles = particles
-        self.image = pygame.Surface((10, 10), pygame.SRCALPHA)
-        pygame.draw.circle(self.image, BULLET_COLOR, (5, 5), 5)
-        self.rect = self.image.get_rect(center=self.pos)
+        self.trail_timer = 0.0
+        super().__init__(*sprites)
+
+    def spawn(self, pos: pygame.Vector2, direction: pygame.Vector2) -> Bullet:
+        """Add a bullet fired from ``pos``, recycling a killed one when available."""
+
+        bullet = self._take_spare()
+        if bullet is None:
+            bullet = Bullet(pos, direction)
+        else:
+            bullet.reset(pos, direction)
+        self.add(bullet)
+        return bullet
+
+    def _pack(self, sprite: Bullet) -> Tuple[float, float, float, float]:
+        return (sprite.pos_x, sprite.pos_y, sprite.dir_x, sprite.dir_y)
 
     def update(self, dt: float) -> None:
-        self.pos += self.direction * BULLET_SPEED * dt
-        self.rect.center = (int(self.pos.x), int(self.pos.y))
-        emit_trail(self.particles, self.pos, BULLET_COLOR)
-        if not (-50 <= self.pos.x <= WIDTH + 50 and -50 <= self.pos.y <= HEIGHT + 50):
-            self.kill()
+        if not self._members:
+            return
+        state = self.state
+        positions = state[:, :2]
+        positions += state[:, 2:] * (BULLET_SPEED * dt)
+        centers = positions.astype(np.int64).tolist()
+        for bullet, (x, y), center in zip(self._members, positions.tolist(), centers):
+            bullet.pos_x = x
+            bullet.pos_y = y
+            bullet.rect.center = center
+        x, y = positions[:, 0], positions[:, 1]
+        self.trail_timer += dt
+        if self.trail_timer >= TRAIL_INTERVAL:
+            self.trail_timer %= TRAIL_INTERVAL
+            visible = (x >= 0) & (x <= WIDTH) & (y >= 0) & (y <= HEIGHT)
+            if visible.any():
+                self.particles.trails(positions[visible], BULLET_COLOR)
+        offscreen = np.flatnonzero((x < -50) | (x > WIDTH + 50) | (y < -50) | (y > HEIGHT + 50))
+        if len(offscreen):
+            for bullet in [self._members[row] for row in offscreen.tolist()]:
+                bullet.kill()
@@ -3,11 +3,15 @@ from __future__ import annotations
 
 import random
 from dataclasses import dataclass
-from typing import List, Tuple
+from typing import Dict, List, Tuple
 
+import numpy as np
 import pygame
 
-from ..config import ENEMY_SPEED
+from ..config import ENEMY_SPEED, MAX_ENEMIES
+from ..kernels import steer_towards
+from ..surfaces import to_display_format
+from .packed_group import PackedGroup
 
 
 @dataclass
@@ -17,29 +21,80 @@ class EnemyAppearance:
     accent: Tuple[int, int, int]
 
 
+ENEMY_SIZE = 36
+
+_ENEMY_SURFACE_CACHE: Dict[Tuple[str, Tuple[int, int, int], Tuple[int, int, int]], pygame.Surface] = {}
+
+
+def get_enemy_surface(
+    shape: str, color: Tuple[int, int, int], accent: Tuple[int, int, int]
+) -> pygame.Surface:
+    """Return the shared enemy image for a shape/colour/accent combination."""
+
+    key = (shape, color, accent)
+    image = _ENEMY_SURFACE_CACHE.get(key)
+    if image is None:
+        image = pygame.Surface((ENEMY_SIZE, ENEMY_SIZE), pygame.SRCALPHA)
+        if shape == "triangle":
+            pygame.draw.polygon(image, color, [(18, 4), (32, 30), (4, 30)])
+        elif shape == "circle":
+            pygame.draw.circle(image, color, (18, 18), 16)
+        else:
+            pygame.draw.rect(image, color, (4, 4, 28, 28), border_radius=6)
+        pygame.draw.circle(image, accent, (18, 14), 6)
+        pygame.draw.circle(image, (0, 0, 0), (18, 14), 3)
+        image = to_display_format(image)
+        _ENEMY_SURFACE_CACHE[key] = image
+    return image
+
+
 class Enemy(pygame.sprite.Sprite):
     def __init__(self, pos: Tuple[float, float], appearance: EnemyAppearance) -> None:
         super().__init__()
-        self.pos = pygame.Vector2(pos)
-        self.velocity = pygame.Vector2()
-        self.image = pygame.Surface((36, 36), pygame.SRCALPHA)
+        self.reset(pos, appearance)
+
+    def reset(self, pos: Tuple[float, float], appearance: EnemyAppearance) -> None:
+        """Re-initialise a recycled enemy in place for a new spawn."""
+
+        self.pos_x, self.pos_y = pos
         color = random.choice(appearance.colors)
-        shape = appearance.shape
-        if shape == "triangle":
-            pygame.draw.polygon(self.image, color, [(18, 4), (32, 30), (4, 30)])
-        elif shape == "circle":
-            pygame.draw.circle(self.image, color, (18, 18), 16)
+        # Enemy images are never mutated, so every spawn can share the cached surface.
+        self.image = get_enemy_surface(appearance.shape, color, appearance.accent)
+        self.rect = self.image.get_rect(center=(int(self.pos_x), int(self.pos_y)))
+
+
+class EnemyGroup(PackedGroup[Enemy]):
+    """Sprite group that steers all of its enemies in one vectorised step."""
+
+    extent = (ENEMY_SIZE, ENEMY_SIZE)
+
+    def __init__(self, *sprites: Enemy) -> None:
+        self._scratch = np.empty((MAX_ENEMIES, 3), dtype=np.float64)
+        super().__init__(*sprites, capacity=MAX_ENEMIES)
+
+    def spawn(self, pos: Tuple[float, float], appearance: EnemyAppearance) -> Enemy:
+        """Add an enemy at ``pos``, recycling a killed one when available."""
+
+        enemy = self._take_spare()
+        if enemy is None:
+            enemy = Enemy(pos, appearance)
         else:
-            pygame.draw.rect(self.image, color, (4, 4, 28, 28), border_radius=6)
-        accent_color = appearance.accent
-        pygame.draw.circle(self.image, accent_color, (18, 14), 6)
-        pygame.draw.circle(self.image, (0, 0, 0), (18, 14), 3)
-        self.rect = self.image.get_rect(center=(int(self.pos.x), int(self.pos.y)))
+            enemy.reset(pos, appearance)
+        self.add(enemy)
+        return enemy
+
+    def _pack(self, sprite: Enemy) -> Tuple[float, float]:
+        return (sprite.pos_x, sprite.pos_y)
 
     def update(self, dt: float, target: pygame.Vector2) -> None:
-        direction = target - self.pos
-        if direction.length_squared() > 0:
-            direction = direction.normalize()
-        self.velocity = direction * ENEMY_SPEED
-        self.pos += self.velocity * dt
-        self.rect.center = (int(self.pos.x), int(self.pos.y))
+        if not self._members:
+            return
+        positions = self.positions
+        if len(self._scratch) < len(positions):
+            self._scratch = np.empty((len(self._state), 3), dtype=np.float64)
+        steer_towards(positions, (target.x, target.y), ENEMY_SPEED * dt, self._scratch)
+        centers = positions.astype(np.int64).tolist()
+        for enemy, (x, y), center in zip(self._members, positions.tolist(), centers):
+            enemy.pos_x = x
+            enemy.pos_y = y
+            enemy.rect.center = center
@@ -0,0 +1,121 @@
+"""Sprite groups that mirror member state into packed NumPy arrays."""
+from __future__ import annotations
+
+from abc import ABCMeta, abstractmethod
+from typing import Dict, Generic, List, Sequence, Tuple, TypeVar
+
+import numpy as np
+import pygame
+
+from ..kernels import overlap_matrix
+
+SpriteT = TypeVar("SpriteT", bound=pygame.sprite.Sprite)
+
+
+class PackedGroup(pygame.sprite.Group, Generic[SpriteT], metaclass=ABCMeta):
+    """Sprite group keeping one float row of state per member for vectorised updates.
+
+    Rows stay contiguous: removing a sprite swaps the last row into the freed
+    slot. Subclasses set ``columns`` and implement ``_pack`` to describe a
+    sprite's initial row, and set ``extent`` to their members' rect size so
+    overlaps can be tested straight from the packed positions.
+
+    The ``(image, rect)`` blit sequence is likewise kept in row order and only
+    edited on add/remove, so members must not swap their image or rect object
+    while in the group (moving the rect in place is fine).
+
+    Removed sprites are kept as spares so subclasses can recycle them for new
+    spawns instead of constructing fresh objects.
+    """
+
+    columns = 2
+    extent: Tuple[int, int] = (0, 0)
+
+    def __init__(self, *sprites: SpriteT, capacity: int = 32) -> None:
+        self._state = np.zeros((capacity, self.columns), dtype=np.float64)
+        self._members: List[SpriteT] = []
+        self._rows: Dict[SpriteT, int] = {}
+        self._spares: List[SpriteT] = []
+        self._blits: List[Tuple[pygame.Surface, pygame.Rect]] = []
+        super().__init__(*sprites)
+
+    @abstractmethod
+    def _pack(self, sprite: SpriteT) -> Sequence[float]:
+        """Return ``sprite``'s initial state row of ``columns`` floats."""
+
+    def add_internal(self, sprite: SpriteT, layer: None = None) -> None:
+        super().add_internal(sprite, layer)
+        count = len(self._members)
+        if count == len(self._state):
+            self._state = np.concatenate((self._state, np.zeros_like(self._state)))
+        self._state[count] = self._pack(sprite)
+        self._rows[sprite] = count
+        self._members.append(sprite)
+        self._blits.append((sprite.image, sprite.rect))
+
+    def remove_internal(self, sprite: SpriteT) -> None:
+        super().remove_internal(sprite)
+        row = self._rows.pop(sprite)
+        last = self._members.pop()
+        last_blit = self._blits.pop()
+        if last is not sprite:
+            self._members[row] = last
+            self._blits[row] = last_blit
+            self._rows[last] = row
+            self._state[row] = self._state[len(self._members)]
+        self._spares.append(sprite)
+
+    def _take_spare(self) -> SpriteT | None:
+        """Pop a previously removed sprite that no group holds any more, if any."""
+
+        spares = self._spares
+        while spares:
+            sprite = spares.pop()
+            if not sprite.alive():
+                return sprite
+        return None
+
+    def draw(self, surface: pygame.Surface, bgsurf: None = None, special_flags: int = 0) -> list:
+        """Blit every member in one ``blits`` call without tracking per-sprite dirty rects."""
+
+        if special_flags:
+            surface.blits([(image, rect, None, special_flags) for image, rect in self._blits], doreturn=False)
+        else:
+            surface.blits(self._blits, doreturn=False)
+        return []
+
+    def overlaps(self, other: PackedGroup) -> np.ndarray:
+        """Boolean ``(len(self), len(other))`` matrix of which members' rects overlap."""
+
+        reach = np.add(self.extent, other.extent) // 2
+        return overlap_matrix(self.positions, other.positions, reach)
+
+    def colliding(self, rect: pygame.Rect) -> List[SpriteT]:
+        """Return the members whose rects overlap ``rect``."""
+
+        if not self._members:
+            return []
+        reach = np.add(self.extent, rect.size) // 2
+        hits = overlap_matrix(np.array([rect.center]), self.positions, reach)[0]
+        return [self._members[row] for row in np.flatnonzero(hits).tolist()]
+
+    @property
+    def members(self) -> List[SpriteT]:
+        """Snapshot of the members in row order."""
+
+        return list(self._members)
+
+    @property
+    def state(self) -> np.ndarray:
+        """View of the live rows, one per member in ``members`` order."""
+
+        return self._state[: len(self._members)]
+
+    @property
+    def positions(self) -> np.ndarray:
+        """View of the live ``(x, y)`` positions; the first two state columns."""
+
+        return self._state[: len(self._members), :2]
+
+
+__all__ = ["PackedGroup"]
@@ -1,7 +1,8 @@
 """Player entity and control logic."""
 from __future__ import annotations
 
-from typing import List, Tuple
+import math
+from typing import Dict, List, Tuple
 
 import pygame
 
@@ -16,28 +17,40 @@ from ..config import (
     SHOOT_COOLDOWN,
     WIDTH,
 )
-from ..particles import ParticleSystem, emit_burst, player_trail
+from ..particles import TRAIL_INTERVAL, ParticleSystem, emit_burst, player_trail
+from ..surfaces import to_display_format
+
+# Unit direction for every combination of opposing key pairs, e.g. (1, -1) for
+# right+up, so movement and aiming never need a per-frame square root.
+_UNIT_DIRECTIONS: Dict[Tuple[int, int], Tuple[float, float]] = {
+    (x, y): (x / math.hypot(x, y), y / math.hypot(x, y)) if x or y else (0.0, 0.0)
+    for x in (-1, 0, 1)
+    for y in (-1, 0, 1)
+}
 
 
 class Player(pygame.sprite.Sprite):
     def __init__(self, particles: ParticleSystem, audio: AudioManager | None = None) -> None:
         super().__init__()
         self.pos = pygame.Vector2()
-        self.velocity = pygame.Vector2()
+        self.vel_x = 0.0
+        self.vel_y = 0.0
         self.particles = particles
         self.audio = audio
         self.image = pygame.Surface((30, 30), pygame.SRCALPHA)
         pygame.draw.polygon(self.image, PLAYER_COLOR, [(15, 0), (30, 25), (15, 30), (0, 25)])
+        self.image = to_display_format(self.image)
         self.base_image = self.image.copy()
         self.rect = self.image.get_rect()
         self.cooldown = 0.0
         self.invulnerable_timer = 0.0
+        self.trail_timer = 0.0
         self.lives = 3
         self.reset()
 
     def reset(self) -> None:
         self.pos.update(WIDTH / 2, HEIGHT / 2)
-        self.velocity.update()
+        self.vel_x = self.vel_y = 0.0
         self.rect.center = (int(self.pos.x), int(self.pos.y))
         self.invulnerable_timer = INVULNERABLE_TIME
         self.cooldown = 0.0
@@ -45,21 +58,22 @@ class Player(pygame.sprite.Sprite):
     def update(
         self, dt: float, keys: pygame.key.ScancodeWrapper
     ) -> List[Tuple[pygame.Vector2, pygame.Vector2]]:
-        move = pygame.Vector2(
-            int(keys[pygame.K_d]) - int(keys[pygame.K_a]),
-            int(keys[pygame.K_s]) - int(keys[pygame.K_w]),
-        )
-        if move.length_squared() > 0:
-            move = move.normalize()
-        self.velocity = move * PLAYER_SPEED
-        self.pos += self.velocity * dt
-        self.pos.x = max(ARENA_MARGIN, min(WIDTH - ARENA_MARGIN, self.pos.x))
-        self.pos.y = max(ARENA_MARGIN, min(HEIGHT - ARENA_MARGIN, self.pos.y))
-        self.rect.center = (int(self.pos.x), int(self.pos.y))
+        move_x = keys[pygame.K_d] - keys[pygame.K_a]
+        move_y = keys[pygame.K_s] - keys[pygame.K_w]
+        moving = bool(move_x or move_y)
+        dir_x, dir_y = _UNIT_DIRECTIONS[move_x, move_y]
+        self.vel_x = dir_x * PLAYER_SPEED
+        self.vel_y = dir_y * PLAYER_SPEED
+        x = max(ARENA_MARGIN, min(WIDTH - ARENA_MARGIN, self.pos.x + self.vel_x * dt))
+        y = max(ARENA_MARGIN, min(HEIGHT - ARENA_MARGIN, self.pos.y + self.vel_y * dt))
+        self.pos.update(x, y)
+        self.rect.center = (int(x), int(y))
 
-        moving = self.velocity.length_squared() > 0
         if moving:
-            player_trail(self.particles, self.pos)
+            self.trail_timer += dt
+            if self.trail_timer >= TRAIL_INTERVAL:
+                self.trail_timer %= TRAIL_INTERVAL
+                player_trail(self.particles, self.pos)
         if self.audio:
             self.audio.update_player_movement(moving)
 
@@ -67,14 +81,11 @@ class Player(pygame.sprite.Sprite):
         self.invulnerable_timer = max(0.0, self.invulnerable_timer - dt)
 
         shots: List[Tuple[pygame.Vector2, pygame.Vector2]] = []
-        shoot_dir = pygame.Vector2(
-            int(keys[pygame.K_RIGHT]) - int(keys[pygame.K_LEFT]),
-            int(keys[pygame.K_DOWN]) - int(keys[pygame.K_UP]),
-        )
-        if shoot_dir.length_squared() > 0:
-            shoot_dir = shoot_dir.normalize()
+        shoot_x = keys[pygame.K_RIGHT] - keys[pygame.K_LEFT]
+        shoot_y = keys[pygame.K_DOWN] - keys[pygame.K_UP]
+        if shoot_x or shoot_y:
             if self.cooldown <= 0:
-                shots.append((self.pos.copy(), shoot_dir))
+                shots.append((self.pos.copy(), pygame.Vector2(_UNIT_DIRECTIONS[shoot_x, shoot_y])))
                 self.cooldown = SHOOT_COOLDOWN
                 emit_burst(
                     self.particles,
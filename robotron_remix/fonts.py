@@ -0,0 +1,22 @@
+"""Shared font lookup for HUD and menu text."""
+from __future__ import annotations
+
+from typing import Dict
+
+import pygame
+
+FONT_NAME = "Consolas"
+
+_FONT_CACHE: Dict[int, pygame.font.Font] = {}
+
+
+def get_font(size: int) -> pygame.font.Font:
+    """Return the game font at ``size``, resolving it through SysFont only once."""
+
+    font = _FONT_CACHE.get(size)
+    if font is None:
+        font = _FONT_CACHE[size] = pygame.font.SysFont(FONT_NAME, size)
+    return font
+
+
+__all__ = ["FONT_NAME", "get_font"]
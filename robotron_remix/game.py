@@ -3,6 +3,7 @@ from __future__ import annotations
 
 import random
 
+import numpy as np
 import pygame
 
 from .audio import AudioManager
@@ -23,9 +24,17 @@ from .config import (
     PLAYER_COLOR,
     WIDTH,
 )
-from .entities import Bullet, Enemy, EnemyAppearance, Player
+from .entities import (
+    BulletGroup,
+    EnemyAppearance,
+    EnemyGroup,
+    Player,
+    get_enemy_surface,
+)
+from .fonts import get_font
 from .high_scores import HighScoreManager
 from .particles import ParticleSystem, emit_burst
+from .surfaces import to_display_format
 from .ui.high_score_screen import HighScoreOutcome, HighScoreScreen
 
 
@@ -38,17 +47,18 @@ class Game:
         self.running = False
         self.exiting = False
 
-        self.all_sprites = pygame.sprite.Group()
-        self.enemy_sprites = pygame.sprite.Group()
-        self.bullet_sprites = pygame.sprite.Group()
-        self.particle_sprites = pygame.sprite.Group()
+        self.particles = ParticleSystem()
+        self.enemy_sprites = EnemyGroup()
+        self.bullet_sprites = BulletGroup(self.particles)
 
-        self.particles = ParticleSystem(self.particle_sprites)
         self.audio = AudioManager()
         self.player = Player(self.particles, audio=self.audio)
-        self.all_sprites.add(self.player)
 
         self.star_field = StarField()
+        self._arena_frame = self._render_arena_frame()
+        self._hud_font = get_font(28)
+        self._hud_labels: dict[str, tuple[int, pygame.Surface]] = {}
+        self._hud_warning = to_display_format(self._hud_font.render("Re-initializing!", True, (255, 240, 120)))
         self.high_scores = HighScoreManager()
         self.high_score_screen = HighScoreScreen(self.screen, self.clock, self.high_scores)
 
@@ -61,6 +71,19 @@ class Game:
         self.current_enemy_appearance = self.get_wave_appearance(self.wave)
         self.prepare_wave()
 
+    @staticmethod
+    def _render_arena_frame() -> pygame.Surface:
+        """Pre-render the arena border and glow onto a colour-keyed full-screen overlay."""
+
+        frame = pygame.Surface((WIDTH, HEIGHT)).convert()
+        frame.fill((0, 0, 0))
+        arena_rect = pygame.Rect(ARENA_MARGIN, ARENA_MARGIN, WIDTH - 2 * ARENA_MARGIN, HEIGHT - 2 * ARENA_MARGIN)
+        pygame.draw.rect(frame, ARENA_COLOR, arena_rect, 4)
+        glow_rect = arena_rect.inflate(12, 12)
+        pygame.draw.rect(frame, (80, 80, 160), glow_rect, 2)
+        frame.set_colorkey((0, 0, 0), pygame.RLEACCEL)
+        return frame
+
     def enemies_for_wave(self, wave: int) -> int:
         return BASE_ENEMIES_PER_WAVE + (wave - 1) * ENEMIES_PER_WAVE_INCREASE
 
@@ -79,6 +102,9 @@ class Game:
         self.current_wave_enemy_limit = self.enemies_for_wave(self.wave)
         self.spawn_interval = self.spawn_interval_for_wave(self.wave)
         self.current_enemy_appearance = self.get_wave_appearance(self.wave)
+        appearance = self.current_enemy_appearance
+        for color in appearance.colors:
+            get_enemy_surface(appearance.shape, color, appearance.accent)
         self.time_since_spawn = 0.0
 
     def spawn_enemy(self) -> None:
@@ -95,9 +121,7 @@ class Game:
             pos = (-20, random.uniform(ARENA_MARGIN, HEIGHT - ARENA_MARGIN))
         else:
             pos = (WIDTH + 20, random.uniform(ARENA_MARGIN, HEIGHT - ARENA_MARGIN))
-        enemy = Enemy(pos, self.current_enemy_appearance)
-        self.enemy_sprites.add(enemy)
-        self.all_sprites.add(enemy)
+        self.enemy_sprites.spawn(pos, self.current_enemy_appearance)
         wave_color = random.choice(self.current_enemy_appearance.colors)
         emit_burst(self.particles, pos, wave_color, amount=25, speed=(40, 150), lifetime=(0.4, 0.8), size=(2, 4))
         self.spawned_this_wave += 1
@@ -106,22 +130,17 @@ class Game:
         keys = pygame.key.get_pressed()
         shots = self.player.update(dt, keys)
         for pos, direction in shots:
-            bullet = Bullet(pos, direction, self.particles)
-            self.bullet_sprites.add(bullet)
-            self.all_sprites.add(bullet)
+            self.bullet_sprites.spawn(pos, direction)
 
-        for enemy in list(self.enemy_sprites):
-            enemy.update(dt, self.player.pos)
+        self.enemy_sprites.update(dt, self.player.pos)
 
-        for bullet in list(self.bullet_sprites):
-            bullet.update(dt)
+        self.bullet_sprites.update(dt)
 
-        for particle in list(self.particle_sprites):
-            particle.update(dt)
+        self.particles.update(dt)
 
         self.handle_collisions()
         self.star_field.update(dt)
-        self.audio.update_enemy_proximity(self.player.pos, self.enemy_sprites)
+        self.audio.update_enemy_proximity(self.player.pos, self.enemy_sprites.positions)
 
         self.time_since_spawn += dt
         if (
@@ -140,15 +159,16 @@ class Game:
             self.prepare_wave()
 
     def handle_collisions(self) -> None:
-        for bullet in pygame.sprite.groupcollide(self.bullet_sprites, self.enemy_sprites, True, True):
-            self.score += 15
-            emit_burst(self.particles, bullet.pos, (255, 180, 80), amount=40, speed=(100, 260), lifetime=(0.3, 0.7), size=(2, 4))
-            emit_burst(self.particles, bullet.pos, (255, 255, 255), amount=12, speed=(200, 360), lifetime=(0.2, 0.4), size=(1, 2))
+        if self.bullet_sprites and self.enemy_sprites:
+            self.handle_bullet_hits()
 
         if self.player.invulnerable:
             return
 
-        if pygame.sprite.spritecollide(self.player, self.enemy_sprites, dokill=True):
+        crashed = self.enemy_sprites.colliding(self.player.rect)
+        for enemy in crashed:
+            enemy.kill()
+        if crashed:
             self.player.lives -= 1
             self.player.invulnerable_timer = INVULNERABLE_TIME
             emit_burst(self.particles, self.player.pos, PLAYER_COLOR, amount=60, speed=(120, 260), lifetime=(0.4, 0.8), size=(2, 4))
@@ -158,45 +178,68 @@ class Game:
             else:
                 self.player.reset()
 
+    def handle_bullet_hits(self) -> None:
+        """Resolve every bullet/enemy overlap from one broadcast test over the packed positions."""
+
+        hits = self.bullet_sprites.overlaps(self.enemy_sprites)
+        if not hits.any():
+            return
+        bullets = self.bullet_sprites.members
+        enemies = self.enemy_sprites.members
+        for row in np.flatnonzero(hits.any(axis=1)).tolist():
+            targets = [enemies[col] for col in np.flatnonzero(hits[row]).tolist() if enemies[col].alive()]
+            if not targets:
+                continue
+            bullet = bullets[row]
+            bullet.kill()
+            for enemy in targets:
+                enemy.kill()
+            self.score += 15
+            hit_pos = (bullet.pos_x, bullet.pos_y)
+            emit_burst(self.particles, hit_pos, (255, 180, 80), amount=40, speed=(100, 260), lifetime=(0.3, 0.7), size=(2, 4))
+            emit_burst(self.particles, hit_pos, (255, 255, 255), amount=12, speed=(200, 360), lifetime=(0.2, 0.4), size=(1, 2))
+
     def draw(self) -> None:
         self.screen.fill(BACKGROUND_COLOR)
         self.star_field.draw(self.screen)
 
-        arena_rect = pygame.Rect(ARENA_MARGIN, ARENA_MARGIN, WIDTH - 2 * ARENA_MARGIN, HEIGHT - 2 * ARENA_MARGIN)
-        pygame.draw.rect(self.screen, ARENA_COLOR, arena_rect, 4)
-        glow_rect = arena_rect.inflate(12, 12)
-        pygame.draw.rect(self.screen, (80, 80, 160), glow_rect, 2)
-
-        for sprite in self.enemy_sprites:
-            self.screen.blit(sprite.image, sprite.rect)
-        for sprite in self.bullet_sprites:
-            self.screen.blit(sprite.image, sprite.rect)
-        for sprite in self.particle_sprites:
-            self.screen.blit(sprite.image, sprite.rect)
+        self.screen.blit(self._arena_frame, (0, 0))
+
+        self.enemy_sprites.draw(self.screen)
+        self.bullet_sprites.draw(self.screen)
+        self.particles.draw(self.screen)
         self.screen.blit(self.player.image, self.player.rect)
 
         self.draw_hud()
         pygame.display.flip()
 
     def draw_hud(self) -> None:
-        font = pygame.font.SysFont("Consolas", 28)
-        score_surface = font.render(f"Score: {self.score}", True, (255, 255, 255))
-        lives_surface = font.render(f"Lives: {self.player.lives}", True, (255, 140, 180))
-        wave_surface = font.render(f"Wave: {self.wave}", True, (200, 220, 255))
+        score_surface = self._hud_label("Score", self.score, (255, 255, 255))
+        lives_surface = self._hud_label("Lives", self.player.lives, (255, 140, 180))
+        wave_surface = self._hud_label("Wave", self.wave, (200, 220, 255))
         self.screen.blit(score_surface, (ARENA_MARGIN, 8))
         self.screen.blit(wave_surface, (WIDTH / 2 - wave_surface.get_width() / 2, 8))
         self.screen.blit(lives_surface, (WIDTH - ARENA_MARGIN - lives_surface.get_width(), 8))
         if self.player.invulnerable:
-            warning = font.render("Re-initializing!", True, (255, 240, 120))
+            warning = self._hud_warning
             self.screen.blit(warning, (WIDTH / 2 - warning.get_width() / 2, HEIGHT - 40))
 
+    def _hud_label(self, label: str, value: int, color: tuple[int, int, int]) -> pygame.Surface:
+        """Return the rendered ``label: value`` text, re-rendering only when the value changes."""
+
+        cached = self._hud_labels.get(label)
+        if cached is None or cached[0] != value:
+            cached = (value, to_display_format(self._hud_font.render(f"{label}: {value}", True, color)))
+            self._hud_labels[label] = cached
+        return cached[1]
+
     def start_new_game(self) -> None:
         self.score = 0
         self.player.lives = 3
         self.player.reset()
         self.enemy_sprites.empty()
         self.bullet_sprites.empty()
-        self.particle_sprites.empty()
+        self.particles.clear()
         self.time_since_spawn = 0.0
         self.wave = 1
         self.prepare_wave()
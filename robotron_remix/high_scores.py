@@ -22,13 +22,9 @@ class HighScoreManager:
         self.load()
 
     def load(self) -> None:
-        if not self.path.exists():
-            self.scores = []
-            return
         try:
-            with self.path.open("r", encoding="utf-8") as fh:
-                data = json.load(fh)
-        except (OSError, json.JSONDecodeError):
+            data = json.loads(self.path.read_bytes())
+        except (OSError, ValueError):
             self.scores = []
             return
         if isinstance(data, list):
@@ -51,15 +47,8 @@ class HighScoreManager:
     def save(self) -> None:
         try:
             self.path.parent.mkdir(parents=True, exist_ok=True)
-            with self.path.open("w", encoding="utf-8") as fh:
-                json.dump(
-                    [
-                        {"initials": entry.initials, "score": entry.score}
-                        for entry in self.scores
-                    ],
-                    fh,
-                    indent=2,
-                )
+            payload = [{"initials": entry.initials, "score": entry.score} for entry in self.scores]
+            self.path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
         except OSError:
             pass
 
@@ -2,83 +2,178 @@
 from __future__ import annotations
 
 import math
-import random
-from dataclasses import dataclass
 from typing import Tuple
 
+import numpy as np
 import pygame
 
-from .config import HEIGHT, PLAYER_COLOR, WIDTH
+from .config import FPS, HEIGHT, PLAYER_COLOR, WIDTH
+from .kernels import step_particles
+from .rng import RNG
+from .surfaces import to_display_format
 
 
-class Particle(pygame.sprite.Sprite):
-    def __init__(
-        self,
-        pos: Tuple[float, float],
-        velocity: pygame.Vector2,
-        color: Tuple[int, int, int],
-        lifetime: float,
-        size: int,
-    ) -> None:
-        super().__init__()
-        self.pos = pygame.Vector2(pos)
-        self.velocity = pygame.Vector2(velocity)
-        self.color = color
-        self.lifetime = lifetime
-        self.age = 0.0
-        self.size = size
-        self.image = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
-        pygame.draw.circle(self.image, color, (size, size), size)
-        self.rect = self.image.get_rect(center=self.pos)
+PARTICLE_CAPACITY = 4096
+PARTICLE_MAX_SIZE = 4
+# Moving entities emit a trail puff at this interval rather than every frame.
+TRAIL_INTERVAL = 0.05
+_TRAIL_AMOUNT = 4
 
-    def update(self, dt: float) -> None:
-        self.age += dt
-        if self.age >= self.lifetime:
-            self.kill()
-            return
+# Colours are quantised to 3 bits per channel ("tones"). An atlas holds one row
+# per tone with a circle image for every (radius, alpha step) pair; a row is
+# rendered in full by the first spawn that uses its tone and shared thereafter.
+_TONE_COUNT = 1 << 9
+_ALPHA_STEPS = 16
+
+
+def _tones(colors: np.ndarray) -> np.ndarray:
+    """Quantise an ``(n, 3)`` array of 0-255 colours to tone indices."""
+
+    tone = colors >> 5
+    return tone[:, 0] << 6 | tone[:, 1] << 3 | tone[:, 2]
+
+
+class _CircleAtlas:
+    """Lazily rendered circle images indexed by ``(tone, radius, alpha step)``.
+
+    With a single alpha step every image is opaque.
+    """
+
+    def __init__(self, max_radius: int, alpha_steps: int = _ALPHA_STEPS) -> None:
+        self.max_radius = max_radius
+        self.alpha_steps = alpha_steps
+        self.row = max_radius * alpha_steps
+        self.images: list[pygame.Surface | None] = [None] * (_TONE_COUNT * self.row)
+        self.rendered = np.zeros(_TONE_COUNT, dtype=bool)
 
-        self.pos += self.velocity * dt
-        fade = max(0, 1 - self.age / self.lifetime)
-        radius = max(1, int(self.size * fade))
-        self.image = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
-        rgba = (*self.color[:3], int(255 * fade))
-        pygame.draw.circle(self.image, rgba, (radius, radius), radius)
-        self.rect = self.image.get_rect(center=self.pos)
+    def prepare(self, tone: np.ndarray) -> None:
+        """Render any rows ``tone`` needs now so drawing never has to check."""
+
+        for missing in np.unique(tone[~self.rendered[tone]]).tolist():
+            self._render_row(missing)
+
+    def index(self, tone: np.ndarray, radius: np.ndarray, alpha_step: np.ndarray | int = 0) -> list[int]:
+        return (tone * self.row + (radius - 1) * self.alpha_steps + alpha_step).tolist()
+
+    def _render_row(self, tone: int) -> None:
+        red, green, blue = ((tone >> shift & 7) << 5 | 16 for shift in (6, 3, 0))
+        base = tone * self.row
+        top = max(1, self.alpha_steps - 1)
+        for radius in range(1, self.max_radius + 1):
+            for alpha_step in range(self.alpha_steps):
+                alpha = 255 if self.alpha_steps == 1 else alpha_step * 255 // top
+                image = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+                pygame.draw.circle(image, (red, green, blue, alpha), (radius, radius), radius)
+                self.images[base + (radius - 1) * self.alpha_steps + alpha_step] = to_display_format(image)
+        self.rendered[tone] = True
+
+
+_PARTICLE_ATLAS = _CircleAtlas(PARTICLE_MAX_SIZE)
+# Celebration glows peak at 1.3x their largest spawn size of 5 and are drawn
+# opaque, as pygame.draw.circle drew them straight onto the display.
+_GLOW_ATLAS = _CircleAtlas(6, alpha_steps=1)
+
+# Spawn headings are drawn from a fixed set of unit vectors instead of calling
+# cos/sin for every new particle.
+_HEADING_COUNT = 1024
+_HEADINGS = np.column_stack(
+    (
+        np.cos(np.linspace(0.0, math.tau, _HEADING_COUNT, endpoint=False)),
+        np.sin(np.linspace(0.0, math.tau, _HEADING_COUNT, endpoint=False)),
+    )
+)
+
+
+def _random_headings(amount: int) -> np.ndarray:
+    """Return ``amount`` random unit vectors as an ``(amount, 2)`` array."""
+
+    return _HEADINGS[RNG.integers(0, _HEADING_COUNT, amount)]
 
 
 class ParticleSystem:
-    """Manage particle sprites for simple burst and trail effects."""
+    """Pool of short-lived particles for burst and trail effects.
+
+    Particle state lives in packed NumPy arrays (live rows are ``[:count]``) so a
+    frame's motion, ageing and culling run as a handful of array operations, and
+    drawing goes through one ``Surface.blits`` call using pre-rendered atlas images.
+    """
+
+    def __init__(self, capacity: int = PARTICLE_CAPACITY) -> None:
+        self.capacity = capacity
+        self.count = 0
+        self.pos = np.zeros((capacity, 2), dtype=np.float64)
+        self.vel = np.zeros((capacity, 2), dtype=np.float64)
+        self.age = np.zeros(capacity, dtype=np.float64)
+        self.lifetime = np.ones(capacity, dtype=np.float64)
+        self.size = np.zeros(capacity, dtype=np.int64)
+        self.tone = np.zeros(capacity, dtype=np.int64)
 
-    def __init__(self, group: pygame.sprite.Group) -> None:
-        self.group = group
+    def __len__(self) -> int:
+        return self.count
+
+    def clear(self) -> None:
+        self.count = 0
 
     def burst(
         self,
-        pos: Tuple[float, float],
+        pos: Tuple[float, float] | np.ndarray,
         base_color: Tuple[int, int, int],
         amount: int,
         speed: Tuple[float, float],
         lifetime: Tuple[float, float],
         size: Tuple[int, int],
     ) -> None:
-        for _ in range(amount):
-            angle = random.uniform(0, math.tau)
-            magnitude = random.uniform(*speed)
-            vel = pygame.Vector2(math.cos(angle), math.sin(angle)) * magnitude
-            color_variation = tuple(
-                min(255, max(0, c + random.randint(-40, 40))) for c in base_color
-            )
-            particle = Particle(
-                pos,
-                vel,
-                color_variation,
-                lifetime=random.uniform(*lifetime),
-                size=random.randint(*size),
-            )
-            self.group.add(particle)
+        """Emit ``amount`` particles from ``pos``, or from each row of an ``(amount, 2)`` array."""
+
+        amount = min(amount, self.capacity - self.count)
+        if amount <= 0:
+            return
+        start, stop = self.count, self.count + amount
+        heading = _random_headings(amount)
+        magnitude = RNG.uniform(speed[0], speed[1], amount)
+        self.pos[start:stop] = pos[:amount] if isinstance(pos, np.ndarray) else pos
+        self.vel[start:stop] = heading * magnitude[:, None]
+        self.age[start:stop] = 0.0
+        self.lifetime[start:stop] = RNG.uniform(lifetime[0], lifetime[1], amount)
+        sizes = RNG.integers(size[0], size[1] + 1, amount)
+        self.size[start:stop] = np.clip(sizes, 1, PARTICLE_MAX_SIZE)
+        colors = np.clip(RNG.integers(-40, 41, (amount, 3)) + base_color, 0, 255)
+        tone = _tones(colors)
+        _PARTICLE_ATLAS.prepare(tone)
+        self.tone[start:stop] = tone
+        self.count = stop
 
     def trail(self, pos: Tuple[float, float], color: Tuple[int, int, int]) -> None:
-        self.burst(pos, color, amount=4, speed=(20, 60), lifetime=(0.2, 0.45), size=(1, 2))
+        self.burst(pos, color, amount=_TRAIL_AMOUNT, speed=(20, 60), lifetime=(0.2, 0.45), size=(1, 2))
+
+    def trails(self, positions: np.ndarray, color: Tuple[int, int, int]) -> None:
+        """Emit a trail puff at every ``(x, y)`` row of ``positions`` in one batch."""
+
+        origins = np.repeat(positions, _TRAIL_AMOUNT, axis=0)
+        self.burst(origins, color, amount=len(origins), speed=(20, 60), lifetime=(0.2, 0.45), size=(1, 2))
+
+    def update(self, dt: float) -> None:
+        if self.count:
+            self.count = step_particles(
+                self.pos, self.vel, self.age, self.lifetime, self.size, self.tone, self.count, dt
+            )
+
+    def draw(self, surface: pygame.Surface) -> None:
+        count = self.count
+        if not count:
+            return
+        fade = np.maximum(0.0, 1 - self.age[:count] / self.lifetime[:count])
+        radius = np.maximum(1, (self.size[:count] * fade).astype(np.int64))
+        alpha_step = (255 * fade).astype(np.int64) >> 4
+        tone = self.tone[:count]
+        pos = self.pos[:count]
+        # Particles in their last alpha step are fully transparent; skip their blits.
+        visible = alpha_step > 0
+        if not visible.all():
+            radius, alpha_step, tone, pos = radius[visible], alpha_step[visible], tone[visible], pos[visible]
+        index = _PARTICLE_ATLAS.index(tone, radius, alpha_step)
+        topleft = (pos - radius[:, None]).tolist()
+        surface.blits(list(zip(map(_PARTICLE_ATLAS.images.__getitem__, index), topleft)), doreturn=False)
 
 
 def emit_burst(
@@ -105,73 +200,92 @@ def emit_trail(
     system.trail(pos_tuple, color)
 
 
-@dataclass
-class CelebrationParticle:
-    position: pygame.Vector2
-    velocity: pygame.Vector2
-    color: Tuple[int, int, int]
-    size: int
-    life: float
-    max_life: float
+# The celebration draws fewer particles while frames run noticeably slower than
+# FPS and restores them once the frame rate holds again. ``dt`` from the clock
+# includes its sleep, so the thresholds are relative to the target frame time.
+_CELEBRATION_MIN_DRAWN = 80
+_CELEBRATION_DRAWN_STEP = 10
+_SLOW_FRAME = 1.25 / FPS
+_STEADY_FRAME = 1.05 / FPS
 
 
 class CelebrationBackground:
-    """Background animation used on the high score screen."""
+    """Background animation used on the high score screen.
+
+    Particles are stored as parallel NumPy arrays so each frame's motion,
+    steering and respawning is a handful of vectorised operations. Colours are
+    kept as atlas tones and drawn with one ``Surface.blits`` call. Only the
+    first ``drawn`` particles are blitted; that number adapts to the frame time
+    while every particle keeps moving, so restored ones reappear mid-flight.
+    """
 
     def __init__(self, count: int = 220) -> None:
-        self.particles: list[CelebrationParticle] = [self._create_particle() for _ in range(count)]
-
-    def _create_particle(self) -> CelebrationParticle:
-        position = pygame.Vector2(random.uniform(0, WIDTH), random.uniform(0, HEIGHT))
-        angle = random.uniform(0, math.tau)
-        speed = random.uniform(60, 180)
-        velocity = pygame.Vector2(math.cos(angle), math.sin(angle)) * speed
-        color = (
-            random.randint(80, 255),
-            random.randint(80, 255),
-            random.randint(80, 255),
-        )
-        size = random.randint(2, 5)
-        life = random.uniform(1.8, 3.8)
-        return CelebrationParticle(position, velocity, color, size, life, life)
-
-    def _reset_particle(self, particle: CelebrationParticle) -> None:
-        particle.position.update(
-            WIDTH / 2 + random.uniform(-WIDTH / 3, WIDTH / 3),
-            HEIGHT / 2 + random.uniform(-HEIGHT / 3, HEIGHT / 3),
-        )
-        angle = random.uniform(0, math.tau)
-        speed = random.uniform(90, 220)
-        particle.velocity.update(math.cos(angle) * speed, math.sin(angle) * speed)
-        particle.color = (
-            random.randint(120, 255),
-            random.randint(120, 255),
-            random.randint(120, 255),
-        )
-        particle.size = random.randint(2, 5)
-        particle.max_life = random.uniform(1.6, 3.6)
-        particle.life = particle.max_life
+        self.count = count
+        self.pos_x = RNG.uniform(0, WIDTH, count).astype(np.float32)
+        self.pos_y = RNG.uniform(0, HEIGHT, count).astype(np.float32)
+        velocity = _random_headings(count) * RNG.uniform(60, 180, (count, 1))
+        self.vel_x = velocity[:, 0].astype(np.float32)
+        self.vel_y = velocity[:, 1].astype(np.float32)
+        self.tone = _tones(RNG.integers(80, 256, (count, 3)))
+        _GLOW_ATLAS.prepare(self.tone)
+        self.size = RNG.integers(2, 6, count).astype(np.float32)
+        self.max_life = RNG.uniform(1.8, 3.8, count).astype(np.float32)
+        self.life = self.max_life.copy()
+        self.drawn = count
+        self._frame_time = 1 / FPS
+
+    def _reset(self, mask: np.ndarray) -> None:
+        """Respawn the particles selected by ``mask`` near the centre of the screen."""
+
+        n = int(np.count_nonzero(mask))
+        self.pos_x[mask] = WIDTH / 2 + RNG.uniform(-WIDTH / 3, WIDTH / 3, n)
+        self.pos_y[mask] = HEIGHT / 2 + RNG.uniform(-HEIGHT / 3, HEIGHT / 3, n)
+        velocity = _random_headings(n) * RNG.uniform(90, 220, (n, 1))
+        self.vel_x[mask] = velocity[:, 0]
+        self.vel_y[mask] = velocity[:, 1]
+        tone = _tones(RNG.integers(120, 256, (n, 3)))
+        _GLOW_ATLAS.prepare(tone)
+        self.tone[mask] = tone
+        self.size[mask] = RNG.integers(2, 6, n)
+        self.max_life[mask] = RNG.uniform(1.6, 3.6, n)
+        self.life[mask] = self.max_life[mask]
 
     def update(self, dt: float) -> None:
-        for particle in self.particles:
-            particle.life -= dt
-            if particle.life <= 0:
-                self._reset_particle(particle)
-                continue
-            particle.position += particle.velocity * dt
-            particle.velocity.rotate_ip(random.uniform(-90, 90) * dt)
-            if not (-120 <= particle.position.x <= WIDTH + 120) or not (
-                -120 <= particle.position.y <= HEIGHT + 120
-            ):
-                self._reset_particle(particle)
+        # Clamp each sample so one long frame (e.g. the first after a screen
+        # switch) cannot trip the threshold on its own.
+        self._frame_time += 0.1 * (min(dt, 2.5 / FPS) - self._frame_time)
+        if self._frame_time > _SLOW_FRAME:
+            self.drawn = max(_CELEBRATION_MIN_DRAWN, self.drawn - _CELEBRATION_DRAWN_STEP)
+        elif self._frame_time < _STEADY_FRAME:
+            self.drawn = min(self.count, self.drawn + _CELEBRATION_DRAWN_STEP)
+
+        self.life -= dt
+        self.pos_x += self.vel_x * dt
+        self.pos_y += self.vel_y * dt
+        theta = np.radians(RNG.uniform(-90, 90, self.count) * dt)
+        c, s = np.cos(theta), np.sin(theta)
+        vel_x = self.vel_x.copy()
+        self.vel_x *= c
+        self.vel_x -= s * self.vel_y
+        self.vel_y *= c
+        self.vel_y += s * vel_x
+        expired = (
+            (self.life <= 0)
+            | (self.pos_x < -120)
+            | (self.pos_x > WIDTH + 120)
+            | (self.pos_y < -120)
+            | (self.pos_y > HEIGHT + 120)
+        )
+        if expired.any():
+            self._reset(expired)
 
     def draw(self, surface: pygame.Surface) -> None:
-        for particle in self.particles:
-            brightness = max(0.0, particle.life / particle.max_life)
-            alpha = int(255 * brightness ** 2)
-            radius = max(1, int(particle.size * (0.5 + brightness * 0.8)))
-            color = (*particle.color, alpha)
-            pygame.draw.circle(surface, color, particle.position, radius)
+        drawn = self.drawn
+        brightness = np.maximum(0.0, self.life[:drawn] / self.max_life[:drawn])
+        radius = np.maximum(1, (self.size[:drawn] * (0.5 + brightness * 0.8)).astype(np.int64))
+        index = _GLOW_ATLAS.index(self.tone[:drawn], radius)
+        topleft = np.column_stack((self.pos_x[:drawn] - radius, self.pos_y[:drawn] - radius)).tolist()
+        surface.blits(list(zip(map(_GLOW_ATLAS.images.__getitem__, index), topleft)), doreturn=False)
 
 
 def player_trail(system: ParticleSystem, pos: Tuple[float, float]) -> None:
@@ -179,11 +293,12 @@ def player_trail(system: ParticleSystem, pos: Tuple[float, float]) -> None:
 
 
 __all__ = [
-    "Particle",
+    "PARTICLE_CAPACITY",
+    "PARTICLE_MAX_SIZE",
+    "TRAIL_INTERVAL",
     "ParticleSystem",
     "emit_burst",
     "emit_trail",
     "player_trail",
-    "CelebrationParticle",
     "CelebrationBackground",
 ]
@@ -0,0 +1,17 @@
+"""Shared NumPy random generator for the vectorised effects."""
+from __future__ import annotations
+
+import numpy as np
+
+# One generator serves every array draw; its vectorised methods are much
+# cheaper per value than the legacy module-level np.random functions.
+RNG = np.random.default_rng()
+
+
+def seed(value: int) -> None:
+    """Reseed the shared generator in place so every user sees the new stream."""
+
+    RNG.bit_generator.state = type(RNG.bit_generator)(value).state
+
+
+__all__ = ["RNG", "seed"]
@@ -0,0 +1,19 @@
+"""Helpers for preparing surfaces for fast blitting."""
+from __future__ import annotations
+
+import pygame
+
+
+def to_display_format(surface: pygame.Surface) -> pygame.Surface:
+    """Return ``surface`` converted to the display's per-pixel-alpha format.
+
+    Converted surfaces blit through SDL's fast paths. Before a display mode is
+    set there is nothing to convert to, so the surface is returned unchanged.
+    """
+
+    if pygame.display.get_surface() is None:
+        return surface
+    return surface.convert_alpha()
+
+
+__all__ = ["to_display_format"]
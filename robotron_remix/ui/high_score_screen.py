@@ -1,14 +1,22 @@
 """High score screen loop and rendering."""
 from __future__ import annotations
 
+import string
 from dataclasses import dataclass
 from typing import List
 
 import pygame
 
-from ..config import FPS, HEIGHT, WIDTH
+from ..config import FPS, HEIGHT, MAX_HIGH_SCORES, WIDTH
+from ..fonts import get_font
 from ..high_scores import HighScoreEntry, HighScoreManager, format_entries
 from ..particles import CelebrationBackground
+from ..surfaces import to_display_format
+
+# The screen only reacts to these. Every other queued event (mouse motion in
+# particular) is drained and discarded in C each frame rather than dispatched
+# through the Python loop, so nothing can pile up while the screen is open.
+_HANDLED_EVENTS = (pygame.QUIT, pygame.KEYDOWN)
 
 
 @dataclass
@@ -22,20 +30,58 @@ class HighScoreScreen:
         self.screen = screen
         self.clock = clock
         self.high_scores = manager
-        self.title_font = pygame.font.SysFont("Consolas", 64)
-        self.entry_font = pygame.font.SysFont("Consolas", 36)
-        self.small_font = pygame.font.SysFont("Consolas", 24)
+        self.title_font = get_font(64)
+        self.entry_font = get_font(36)
+        self.small_font = get_font(24)
+        self._text_cache: dict[tuple[pygame.font.Font, str, tuple[int, int, int]], pygame.Surface] = {}
+        self._static_layers: dict[str, pygame.Surface] = {}
+        self._letters = [self._text(self.entry_font, letter, (255, 255, 255)) for letter in string.ascii_uppercase]
+
+    def _text(self, font: pygame.font.Font, text: str, color: tuple[int, int, int]) -> pygame.Surface:
+        """Return ``text`` rendered in ``font``, rendering each distinct string only once."""
+
+        key = (font, text, color)
+        surface = self._text_cache.get(key)
+        if surface is None:
+            surface = self._text_cache[key] = to_display_format(font.render(text, True, color))
+        return surface
+
+    def _static_layer(self, prompt_text: str) -> pygame.Surface:
+        """Return the overlay, title, rank numbers and ``prompt_text`` composited once per prompt."""
+
+        layer = self._static_layers.get(prompt_text)
+        if layer is not None:
+            return layer
+        layer = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
+        layer.fill((10, 10, 30, 180))
+
+        title_text = self._text(self.title_font, "HIGH SCORES", (255, 255, 255))
+        layer.blit(title_text, (WIDTH / 2 - title_text.get_width() / 2, 60))
+
+        prompt_surface = self._text(self.small_font, prompt_text, (200, 220, 255))
+        layer.blit(prompt_surface, (WIDTH / 2 - prompt_surface.get_width() / 2, HEIGHT - 80))
+
+        top_offset = 220
+        for index in range(MAX_HIGH_SCORES):
+            label_surface = self._text(self.entry_font, f"{index + 1}.", (180, 200, 255))
+            layer.blit(label_surface, (WIDTH / 2 - 220, top_offset + index * 50))
+
+        layer = self._static_layers[prompt_text] = to_display_format(layer)
+        return layer
 
     def show(self, start: bool, new_score: int | None = None) -> HighScoreOutcome:
         background = CelebrationBackground()
         entering_initials = new_score is not None and self.high_scores.qualifies(new_score)
-        initials: List[str] = ["A", "A", "A"]
+        # Initials are letter indices into string.ascii_uppercase.
+        initials: List[int] = [0, 0, 0]
         selected_index = 0
         highlight_entry: HighScoreEntry | None = None
 
         while True:
             dt = self.clock.tick(FPS) / 1000.0
-            for event in pygame.event.get():
+            events = pygame.event.get(_HANDLED_EVENTS)
+            pygame.event.get(exclude=_HANDLED_EVENTS, pump=False)
+            for event in events:
                 if event.type == pygame.QUIT:
                     return HighScoreOutcome(False, True)
                 if event.type == pygame.KEYDOWN:
@@ -45,15 +91,13 @@ class HighScoreScreen:
                         elif event.key == pygame.K_LEFT:
                             selected_index = (selected_index - 1) % len(initials)
                         elif event.key == pygame.K_UP:
-                            initials[selected_index] = chr(
-                                (ord(initials[selected_index]) - ord("A") + 1) % 26 + ord("A")
-                            )
+                            initials[selected_index] = (initials[selected_index] + 1) % 26
                         elif event.key == pygame.K_DOWN:
-                            initials[selected_index] = chr(
-                                (ord(initials[selected_index]) - ord("A") - 1) % 26 + ord("A")
-                            )
+                            initials[selected_index] = (initials[selected_index] - 1) % 26
                         elif event.key == pygame.K_RETURN and new_score is not None:
-                            highlight_entry = self.high_scores.add_score("".join(initials), int(new_score))
+                            highlight_entry = self.high_scores.add_score(
+                                "".join(string.ascii_uppercase[letter] for letter in initials), int(new_score)
+                            )
                             entering_initials = False
                         elif event.key == pygame.K_ESCAPE:
                             return HighScoreOutcome(False, False)
@@ -73,41 +117,29 @@ class HighScoreScreen:
         start: bool,
         new_score: int | None,
         entering_initials: bool,
-        initials: List[str],
+        initials: List[int],
         selected_index: int,
         highlight_entry: HighScoreEntry | None,
     ) -> None:
         self.screen.fill((10, 8, 40))
         background.draw(self.screen)
 
-        overlay = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
-        overlay.fill((10, 10, 30, 180))
-        self.screen.blit(overlay, (0, 0))
-
-        title_text = self.title_font.render("HIGH SCORES", True, (255, 255, 255))
-        self.screen.blit(title_text, (WIDTH / 2 - title_text.get_width() / 2, 60))
-
-        if new_score is not None:
-            score_label = self.entry_font.render(f"Your Score: {new_score}", True, (255, 230, 130))
-            self.screen.blit(score_label, (WIDTH / 2 - score_label.get_width() / 2, 140))
-
         if entering_initials:
             prompt_text = "New high score! Use arrow keys to set your initials."
         elif start:
             prompt_text = "Press Enter to start or Esc to quit."
         else:
             prompt_text = "Press Enter to play again or Esc to quit."
+        self.screen.blit(self._static_layer(prompt_text), (0, 0))
 
-        prompt_surface = self.small_font.render(prompt_text, True, (200, 220, 255))
-        self.screen.blit(prompt_surface, (WIDTH / 2 - prompt_surface.get_width() / 2, HEIGHT - 80))
+        if new_score is not None:
+            score_label = self._text(self.entry_font, f"Your Score: {new_score}", (255, 230, 130))
+            self.screen.blit(score_label, (WIDTH / 2 - score_label.get_width() / 2, 140))
 
         highlight_consumed = False
         top_offset = 220
         for index, (initials_text, score_value) in enumerate(format_entries(self.high_scores.scores)):
             line_y = top_offset + index * 50
-            label_surface = self.entry_font.render(f"{index + 1}.", True, (180, 200, 255))
-            self.screen.blit(label_surface, (WIDTH / 2 - 220, line_y))
-
             highlight = False
             if highlight_entry and not highlight_consumed and score_value is not None:
                 if initials_text == highlight_entry.initials and score_value == highlight_entry.score:
@@ -116,15 +148,15 @@ class HighScoreScreen:
 
             initials_color = (255, 255, 255) if not highlight else (255, 250, 180)
             score_color = (200, 220, 255) if not highlight else (255, 240, 200)
-            initials_surface = self.entry_font.render(initials_text, True, initials_color)
+            initials_surface = self._text(self.entry_font, initials_text, initials_color)
             score_display = "---" if score_value is None else str(score_value)
-            score_surface = self.entry_font.render(score_display, True, score_color)
+            score_surface = self._text(self.entry_font, score_display, score_color)
             self.screen.blit(initials_surface, (WIDTH / 2 - initials_surface.get_width() / 2, line_y))
             self.screen.blit(score_surface, (WIDTH / 2 + 140 - score_surface.get_width(), line_y))
 
         if entering_initials and new_score is not None:
             initials_display_y = HEIGHT - 160
-            initials_label = self.entry_font.render("Initials:", True, (255, 255, 255))
+            initials_label = self._text(self.entry_font, "Initials:", (255, 255, 255))
             label_rect = initials_label.get_rect()
             label_rect.midright = (WIDTH / 2 - 120, initials_display_y + 15)
             self.screen.blit(initials_label, label_rect.topleft)
@@ -132,7 +164,7 @@ class HighScoreScreen:
             letter_spacing = 70
             first_letter_x = label_rect.right + 20
             for idx, letter in enumerate(initials):
-                letter_surface = self.entry_font.render(letter, True, (255, 255, 255))
+                letter_surface = self._letters[letter]
                 letter_rect = letter_surface.get_rect()
                 letter_rect.center = (
                     first_letter_x + idx * letter_spacing,
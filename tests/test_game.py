@@ -0,0 +1,35 @@
+"""Lifecycle checks for the game orchestration."""
+from __future__ import annotations
+
+import os
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+import pytest
+
+from robotron_remix.game import Game
+
+
+@pytest.fixture
+def game() -> Game:
+    # pygame stays initialised afterwards: fonts.get_font caches Font objects
+    # that must not outlive the font module.
+    return Game()
+
+
+def test_restart_recycles_enemies_and_bullets(game: Game) -> None:
+    game.start_new_game()
+    for _ in range(3):
+        game.spawn_enemy()
+    bullet = game.bullet_sprites.spawn(pygame.Vector2(100, 100), pygame.Vector2(1, 0))
+    enemies = set(game.enemy_sprites.members)
+    assert len(enemies) == 3
+
+    game.start_new_game()
+    assert not game.enemy_sprites and not game.bullet_sprites
+    for _ in range(3):
+        game.spawn_enemy()
+    assert set(game.enemy_sprites.members) == enemies
+    assert game.bullet_sprites.spawn(pygame.Vector2(5, 5), pygame.Vector2(0, 1)) is bullet
@@ -0,0 +1,44 @@
+"""Event handling checks for the high score screen."""
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+import pytest
+
+from robotron_remix.config import HEIGHT, WIDTH
+from robotron_remix.high_scores import HighScoreManager
+from robotron_remix.ui.high_score_screen import HighScoreOutcome, HighScoreScreen
+
+
+@pytest.fixture
+def screen(tmp_path: Path) -> HighScoreScreen:
+    pygame.display.init()
+    pygame.font.init()
+    surface = pygame.display.set_mode((WIDTH, HEIGHT))
+    return HighScoreScreen(surface, pygame.time.Clock(), HighScoreManager(tmp_path / "scores.json"))
+
+
+def test_unhandled_events_are_drained(screen: HighScoreScreen) -> None:
+    pygame.event.clear()
+    for _ in range(5):
+        pygame.event.post(
+            pygame.event.Event(pygame.FINGERMOTION, touch_id=0, finger_id=0, x=0.5, y=0.5, dx=0.0, dy=0.0)
+        )
+        pygame.event.post(pygame.event.Event(pygame.JOYAXISMOTION, joy=0, instance_id=0, axis=0, value=0.5))
+        pygame.event.post(pygame.event.Event(pygame.USEREVENT))
+    pygame.event.post(pygame.event.Event(pygame.QUIT))
+
+    assert screen.show(start=True) == HighScoreOutcome(False, True)
+    assert pygame.event.get(pump=False) == []
+
+
+def test_key_events_are_handled(screen: HighScoreScreen) -> None:
+    pygame.event.clear()
+    pygame.event.post(pygame.event.Event(pygame.MOUSEMOTION, pos=(1, 1), rel=(1, 1), buttons=(0, 0, 0)))
+    pygame.event.post(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_RETURN, mod=0, unicode="\r", scancode=0))
+
+    assert screen.show(start=True) == HighScoreOutcome(True, False)
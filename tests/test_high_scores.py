@@ -0,0 +1,63 @@
+"""Persistence checks for the high score table."""
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+from robotron_remix.config import MAX_HIGH_SCORES
+from robotron_remix.high_scores import HighScoreEntry, HighScoreManager
+
+
+def test_round_trip(tmp_path: Path) -> None:
+    path = tmp_path / "scores.json"
+    manager = HighScoreManager(path)
+    manager.add_score("abc", 300)
+    manager.add_score("XYZ", 500)
+
+    reloaded = HighScoreManager(path)
+    assert reloaded.scores == [HighScoreEntry("XYZ", 500), HighScoreEntry("ABC", 300)]
+
+
+def test_save_keeps_only_the_best(tmp_path: Path) -> None:
+    manager = HighScoreManager(tmp_path / "scores.json")
+    for score in range(1, MAX_HIGH_SCORES + 3):
+        manager.add_score("AAA", score * 10)
+
+    scores = [entry.score for entry in HighScoreManager(manager.path).scores]
+    assert scores == sorted(scores, reverse=True)
+    assert len(scores) == MAX_HIGH_SCORES
+
+
+def test_missing_file(tmp_path: Path) -> None:
+    assert HighScoreManager(tmp_path / "absent" / "scores.json").scores == []
+
+
+def test_malformed_json(tmp_path: Path) -> None:
+    path = tmp_path / "scores.json"
+    path.write_text("[{\"initials\": \"ABC\", ", encoding="utf-8")
+    assert HighScoreManager(path).scores == []
+
+
+def test_non_utf8_bytes(tmp_path: Path) -> None:
+    path = tmp_path / "scores.json"
+    path.write_bytes(b"[{\"initials\": \"\xff\xfe\", \"score\": 10}]")
+    assert HighScoreManager(path).scores == []
+
+
+def test_invalid_entries_are_skipped(tmp_path: Path) -> None:
+    path = tmp_path / "scores.json"
+    payload = [
+        {"initials": "abcd", "score": 40},
+        {"initials": 12, "score": 90},
+        {"initials": "QQQ", "score": "high"},
+        "junk",
+        {"initials": "ZZ", "score": 70},
+    ]
+    path.write_text(json.dumps(payload), encoding="utf-8")
+    assert HighScoreManager(path).scores == [HighScoreEntry("ZZ", 70), HighScoreEntry("ABC", 40)]
+
+
+def test_non_list_payload(tmp_path: Path) -> None:
+    path = tmp_path / "scores.json"
+    path.write_text(json.dumps({"initials": "ABC", "score": 10}), encoding="utf-8")
+    assert HighScoreManager(path).scores == []
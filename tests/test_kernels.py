@@ -0,0 +1,68 @@
+"""Checks for the array kernels against their scalar equivalents."""
+from __future__ import annotations
+
+import math
+
+import numpy as np
+import pygame
+
+from robotron_remix.kernels import min_distance_sq, overlap_matrix, step_particles, steer_towards
+
+
+def test_overlap_matrix_matches_colliderect() -> None:
+    rng = np.random.default_rng(3)
+    a_size, b_size = (10, 10), (36, 36)
+    reach = np.add(a_size, b_size) // 2
+    for _ in range(300):
+        a = rng.uniform(0, 200, (12, 2))
+        b = rng.uniform(0, 200, (8, 2))
+        a_rects = [pygame.Rect((0, 0), a_size) for _ in a]
+        b_rects = [pygame.Rect((0, 0), b_size) for _ in b]
+        for rect, (x, y) in zip(a_rects, a.tolist()):
+            rect.center = (int(x), int(y))
+        for rect, (x, y) in zip(b_rects, b.tolist()):
+            rect.center = (int(x), int(y))
+        expected = np.array([[ra.colliderect(rb) for rb in b_rects] for ra in a_rects])
+        assert (overlap_matrix(a, b, reach) == expected).all()
+
+
+def test_overlap_matrix_handles_empty_inputs() -> None:
+    hits = overlap_matrix(np.empty((0, 2)), np.zeros((3, 2)), np.array([5, 5]))
+    assert hits.shape == (0, 3)
+
+
+def test_steer_towards_moves_by_step() -> None:
+    positions = np.array([[0.0, 0.0], [10.0, 10.0], [3.0, 4.0]])
+    scratch = np.empty((3, 3))
+    steer_towards(positions, (3.0, 4.0), 1.0, scratch)
+    assert np.allclose(positions[0], (0.6, 0.8))
+    assert math.isclose(math.hypot(*(positions[1] - (10.0, 10.0))), 1.0)
+
+
+def test_steer_towards_stays_put_at_target() -> None:
+    positions = np.array([[3.0, 4.0]])
+    steer_towards(positions, (3.0, 4.0), 5.0, np.empty((1, 3)))
+    assert np.isfinite(positions).all()
+    assert np.allclose(positions, [[3.0, 4.0]])
+
+
+def test_min_distance_sq() -> None:
+    positions = np.array([[3.0, 4.0], [1.0, 1.0]])
+    assert min_distance_sq(positions, (0.0, 0.0)) == 2.0
+    assert min_distance_sq(np.empty((0, 2)), (0.0, 0.0)) == math.inf
+
+
+def test_step_particles_compacts_in_order() -> None:
+    capacity = 6
+    pos = np.arange(capacity * 2, dtype=np.float64).reshape(capacity, 2)
+    vel = np.ones((capacity, 2))
+    age = np.array([0.0, 0.9, 0.0, 0.9, 0.0, 0.0])
+    lifetime = np.ones(capacity)
+    size = np.arange(capacity)
+    tone = np.arange(capacity) * 10
+    kept = step_particles(pos, vel, age, lifetime, size, tone, 5, 0.5)
+    assert kept == 3
+    assert size[:kept].tolist() == [0, 2, 4]
+    assert tone[:kept].tolist() == [0, 20, 40]
+    assert np.allclose(age[:kept], 0.5)
+    assert np.allclose(pos[:kept], [[0.5, 1.5], [4.5, 5.5], [8.5, 9.5]])
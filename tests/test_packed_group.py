@@ -0,0 +1,104 @@
+"""Bookkeeping checks for the packed sprite groups."""
+from __future__ import annotations
+
+import random
+
+import numpy as np
+import pygame
+import pytest
+
+from robotron_remix.entities import BulletGroup, EnemyAppearance, EnemyGroup
+from robotron_remix.particles import ParticleSystem
+
+APPEARANCE = EnemyAppearance([(200, 60, 60), (60, 200, 60)], "square", (255, 255, 255))
+
+
+def assert_in_sync(group: EnemyGroup) -> None:
+    members = group.members
+    assert len(group) == len(members) == len(group._rows) == len(group._blits) == len(group.state)
+    for row, sprite in enumerate(members):
+        assert group._rows[sprite] == row
+        assert tuple(group.state[row]) == (sprite.pos_x, sprite.pos_y)
+        image, rect = group._blits[row]
+        assert image is sprite.image
+        assert rect is sprite.rect
+
+
+def spawn_many(group: EnemyGroup, count: int) -> list:
+    return [group.spawn((float(10 * i), float(20 * i)), APPEARANCE) for i in range(count)]
+
+
+@pytest.mark.parametrize("row", [0, 2, 4])
+def test_kill_keeps_rows_in_sync(row: int) -> None:
+    group = EnemyGroup()
+    enemies = spawn_many(group, 5)
+    enemies[row].kill()
+    assert enemies[row] not in group
+    assert_in_sync(group)
+
+
+def test_kill_everything_from_the_middle_out() -> None:
+    group = EnemyGroup()
+    enemies = spawn_many(group, 6)
+    for index in (3, 0, 5, 1, 4, 2):
+        enemies[index].kill()
+        assert_in_sync(group)
+    assert not group
+
+
+def test_rows_follow_updates() -> None:
+    group = EnemyGroup()
+    spawn_many(group, 4)
+    group.update(0.1, pygame.Vector2(300, 300))
+    group.members[1].kill()
+    group.update(0.1, pygame.Vector2(300, 300))
+    assert_in_sync(group)
+    for enemy in group:
+        assert enemy.rect.center == (int(enemy.pos_x), int(enemy.pos_y))
+
+
+def test_spawn_reuses_killed_sprite() -> None:
+    group = EnemyGroup()
+    enemy = group.spawn((5.0, 5.0), APPEARANCE)
+    enemy.kill()
+    reused = group.spawn((50.0, 60.0), APPEARANCE)
+    assert reused is enemy
+    assert (reused.pos_x, reused.pos_y) == (50.0, 60.0)
+    assert_in_sync(group)
+
+
+def test_spawn_skips_sprite_alive_in_another_group() -> None:
+    group = EnemyGroup()
+    other = pygame.sprite.Group()
+    enemy = group.spawn((5.0, 5.0), APPEARANCE)
+    other.add(enemy)
+    group.remove(enemy)
+    fresh = group.spawn((50.0, 60.0), APPEARANCE)
+    assert fresh is not enemy
+    assert enemy in other
+    assert_in_sync(group)
+
+
+def test_random_churn_stays_in_sync() -> None:
+    rng = random.Random(7)
+    group = EnemyGroup()
+    target = pygame.Vector2(400, 300)
+    for _ in range(500):
+        if rng.random() < 0.5 or not group:
+            group.spawn((rng.uniform(0, 800), rng.uniform(0, 600)), APPEARANCE)
+        else:
+            rng.choice(group.members).kill()
+        group.update(1 / 60, target)
+        assert_in_sync(group)
+
+
+def test_fresh_bullets_overlap_like_their_rects() -> None:
+    rng = random.Random(11)
+    for _ in range(50):
+        enemies = EnemyGroup()
+        bullets = BulletGroup(ParticleSystem())
+        for _ in range(6):
+            enemies.spawn((rng.uniform(0, 200), rng.uniform(0, 200)), APPEARANCE)
+            bullets.spawn(pygame.Vector2(rng.uniform(0, 200), rng.uniform(0, 200)), pygame.Vector2(1, 0))
+        expected = np.array([[b.rect.colliderect(e.rect) for e in enemies.members] for b in bullets.members])
+        assert (bullets.overlaps(enemies) == expected).all()
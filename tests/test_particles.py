@@ -0,0 +1,74 @@
+"""Checks for the particle pool and its circle atlas."""
+from __future__ import annotations
+
+import numpy as np
+import pygame
+
+from robotron_remix import particles
+from robotron_remix.particles import PARTICLE_MAX_SIZE, CelebrationBackground, ParticleSystem
+
+
+def burst(system: ParticleSystem, amount: int, lifetime: float = 0.5, color=(255, 180, 80)) -> None:
+    system.burst((50.0, 50.0), color, amount=amount, speed=(10, 20), lifetime=(lifetime, lifetime), size=(1, 4))
+
+
+def test_burst_truncates_at_capacity() -> None:
+    system = ParticleSystem(capacity=10)
+    burst(system, 8)
+    burst(system, 8)
+    assert len(system) == 10
+    burst(system, 3)
+    assert len(system) == 10
+
+
+def test_burst_from_array_origins() -> None:
+    system = ParticleSystem(capacity=8)
+    origins = np.array([[1.0, 2.0], [3.0, 4.0], [5.0, 6.0]])
+    system.burst(origins, (0, 0, 0), amount=3, speed=(0, 0), lifetime=(1, 1), size=(1, 1))
+    assert np.array_equal(system.pos[:3], origins)
+
+
+def test_update_compacts_expired_particles() -> None:
+    system = ParticleSystem(capacity=32)
+    burst(system, 5, lifetime=0.1)
+    burst(system, 7, lifetime=1.0)
+    burst(system, 3, lifetime=0.1)
+    system.update(0.5)
+    assert len(system) == 7
+    assert np.allclose(system.lifetime[:7], 1.0)
+    assert np.allclose(system.age[:7], 0.5)
+    system.update(1.0)
+    assert len(system) == 0
+
+
+def test_atlas_index_bounds() -> None:
+    atlas = particles._PARTICLE_ATLAS
+    tone = np.array([0, particles._TONE_COUNT - 1])
+    atlas.prepare(tone)
+    radius = np.array([1, PARTICLE_MAX_SIZE])
+    alpha_step = np.array([0, particles._ALPHA_STEPS - 1])
+    first, last = atlas.index(tone, radius, alpha_step)
+    assert first == 0
+    assert last == len(atlas.images) - 1
+    assert atlas.images[first].get_size() == (2, 2)
+    assert atlas.images[last].get_size() == (2 * PARTICLE_MAX_SIZE, 2 * PARTICLE_MAX_SIZE)
+
+
+def test_draw_covers_fresh_and_fading_particles() -> None:
+    surface = pygame.Surface((100, 100))
+    for color in ((0, 0, 0), (255, 255, 255)):
+        system = ParticleSystem(capacity=64)
+        burst(system, 32, lifetime=1.0, color=color)
+        system.size[:32] = PARTICLE_MAX_SIZE
+        system.draw(surface)
+        system.age[:32] = np.linspace(0.0, 0.999, 32)
+        system.draw(surface)
+
+
+def test_celebration_draws_at_full_and_no_life() -> None:
+    surface = pygame.Surface((100, 100))
+    background = CelebrationBackground(count=16)
+    background.size[:] = 5
+    background.draw(surface)
+    background.life[:] = 0
+    background.draw(surface)
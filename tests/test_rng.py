@@ -0,0 +1,25 @@
+"""Checks for the shared random generator."""
+from __future__ import annotations
+
+import numpy as np
+import pygame
+
+from robotron_remix import rng
+from robotron_remix.background import StarField
+from robotron_remix.particles import ParticleSystem
+
+
+def sample() -> tuple[np.ndarray, bytes]:
+    system = ParticleSystem(capacity=16)
+    system.burst((0.0, 0.0), (120, 120, 120), amount=16, speed=(10, 50), lifetime=(0.2, 0.8), size=(1, 4))
+    stars = StarField(count=40)
+    return system.vel[:16].copy(), b"".join(pygame.image.tobytes(layer, "RGB") for layer in stars._layers)
+
+
+def test_seed_reproduces_particles_and_stars() -> None:
+    rng.seed(5)
+    first = sample()
+    rng.seed(5)
+    second = sample()
+    assert np.array_equal(first[0], second[0])
+    assert first[1] == second[1]